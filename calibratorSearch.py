@@ -3,14 +3,24 @@
 import os
 import re
 import sys
-import ephem
+import gzip
+import http.client
+import time
+import hashlib
+import tempfile
+import threading
 import numpy
 import argparse
-from urllib.request import urlopen
-from urllib.parse import urlencode, quote_plus
-from tempfile import NamedTemporaryFile
-from xml.etree import ElementTree
-import astropy.io.fits as astrofits
+import warnings
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urljoin, urlsplit, quote_plus
+from urllib.request import Request, ProxyHandler, build_opener, getproxies, proxy_bypass
+try:
+    from lxml import etree as ElementTree
+except ImportError:
+    from xml.etree import ElementTree
 
 import wx
 import wx.html as html
@@ -21,13 +31,10 @@ import matplotlib
 matplotlib.use('WXAgg')
 matplotlib.interactive(True)
 
-from matplotlib.backends.backend_wxagg import NavigationToolbar2WxAgg, FigureCanvasWxAgg
-from matplotlib.figure import Figure
-from matplotlib.ticker import FuncFormatter, NullFormatter, NullLocator
+from matplotlib.ticker import Formatter, NullFormatter, NullLocator
 
 import lsl
 from lsl.misc.lru_cache import lru_cache
-from lsl.misc import parser as aph
 
 
 __version__ = "0.1"
@@ -58,9 +65,313 @@ else:
 ORANGE = wx.Colour(0xFF, 0xA5, 0x00)
 
 
+# Markers for the start and end of the source table in a VLSSr search
+VLSSR_LIST_HEADER = b'h  m    s    d  m   s   Ori      Jy'
+VLSSR_LIST_FOOTER = b'Found'
+
+
+# Columns to read from the VLSSr source table
+VLSSR_LIST_DTYPE = [('rah', 'U16'), ('ram', 'U16'), ('ras', 'U16'), 
+                    ('decd', 'U16'), ('decm', 'U16'), ('decs', 'U16'), 
+                    ('sep', 'f8'), ('flux', 'f8'), 
+                    ('maj', 'U16'), ('min', 'U16'), ('pa', 'U16')]
+
+
+VOTABLE_NS = {'VO': 'http://www.ivoa.net/xml/VOTable/v1.2'}
+
+
+# Well-formed sexagesimal RA and declination values
+RA_RE = re.compile(r'^\s*\d{1,2}[:\s]\d{1,2}[:\s]\d{1,2}(\.\d*)?\s*$')
+DEC_RE = re.compile(r'^\s*[-+]?\d{1,2}[:\s]\d{1,2}[:\s]\d{1,2}(\.\d*)?\s*$')
+
+
+def _sexagesimal_type(regex, label):
+    """
+    Build an argparse type that checks a command line value against one of 
+    the sexagesimal regular expressions and returns the value as a string.
+    """
+    
+    def check(string):
+        if not regex.match(string):
+            raise argparse.ArgumentTypeError(f"{string} is not a valid {label}")
+        return string.strip()
+    return check
+
+
 SIMBAD_REF_RE = re.compile('^(\[(?P<ref>[A-Za-z0-9]+)\]\s*)')
 
 
+# Search radii (in arcsec) used to pick a SIMBAD counterpart for a source.  The
+# best studied object within the smallest radius that has any matches wins.
+SIMBAD_RADII = (15.0, 30.0, 60.0)
+
+
+class _NoMatch(Exception):
+    """
+    Raised by a lookup that found nothing.
+    """
+
+
+def _to_degrees(value, hours=False):
+    """
+    Convert a sexagesimal value, with the fields separated by colons or 
+    spaces, into decimal degrees.  If hours is True the value is taken to be
+    in hours.  A value with only one field is taken to be in degrees.
+    """
+    
+    fields = value.replace(':', ' ').split()
+    degrees = 0.0
+    for i,field in enumerate(fields):
+        degrees += abs(float(field)) / 60.0**i
+    if hours and len(fields) > 1:
+        degrees *= 15.0
+    if fields[0].startswith('-'):
+        degrees = -degrees
+    return degrees
+
+
+def _separation(ra0, dec0, ra1, dec1):
+    """
+    Return the angular separation in arcsec between two positions given in 
+    degrees.
+    """
+    
+    ra0, dec0, ra1, dec1 = numpy.radians([ra0, dec0, ra1, dec1])
+    hav = numpy.sin((dec1-dec0)/2)**2 + numpy.cos(dec0)*numpy.cos(dec1)*numpy.sin((ra1-ra0)/2)**2
+    return float(numpy.degrees(2*numpy.arcsin(numpy.sqrt(min(hav, 1.0)))) * 3600.0)
+
+
+# Per-thread persistent connections to the query services, the timeout (in s)
+# to use on them, and how many times to retry (with what initial backoff in s)
+# a query that fails with a dropped connection or a server error
+_HTTP_LOCAL = threading.local()
+HTTP_TIMEOUT = 30
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.3
+
+
+def _http_connection(scheme, netloc, fresh=False):
+    """
+    Return a persistent HTTP or HTTPS connection to the given server for the 
+    current thread.  If fresh is True any existing connection is closed and
+    replaced.
+    """
+    
+    try:
+        connections = _HTTP_LOCAL.connections
+    except AttributeError:
+        connections = _HTTP_LOCAL.connections = {}
+        
+    key = (scheme, netloc)
+    if fresh and key in connections:
+        connections.pop(key).close()
+    if key not in connections:
+        if scheme == 'https':
+            connections[key] = http.client.HTTPSConnection(netloc, timeout=HTTP_TIMEOUT)
+        else:
+            connections[key] = http.client.HTTPConnection(netloc, timeout=HTTP_TIMEOUT)
+    return connections[key]
+
+
+def _proxied_get(url, data=None, proxies=None):
+    """
+    Fetch a URL, POSTing data if it is provided, through the given proxies 
+    with urllib.  This is used in place of the persistent connections when a 
+    proxy is configured for the server.  Returns the decompressed body of the
+    response as bytes.
+    """
+    
+    opener = build_opener(ProxyHandler(proxies))
+    request = Request(url, data=data, headers={'Accept-Encoding': 'gzip'})
+    with opener.open(request, timeout=HTTP_TIMEOUT) as response:
+        body = response.read()
+        if response.getheader('Content-Encoding', '') == 'gzip':
+            body = gzip.decompress(body)
+    return body
+
+
+def _http_get(url, data=None, max_redirects=5):
+    """
+    Fetch a URL, POSTing data if it is provided, over a persistent connection
+    so that repeated queries to the same server do not need a new connection
+    for each one.  Redirects are followed and a gzip compressed response is 
+    requested.  If a proxy is configured for the server the query is passed 
+    to _proxied_get instead.  Returns the decompressed body of the response 
+    as bytes.
+    """
+    
+    proxies = getproxies()
+    
+    for i in range(max_redirects+1):
+        parts = urlsplit(url)
+        
+        ## The persistent connections go straight to the server so hand off 
+        ## to urllib, which knows how to use a proxy, if there is one
+        if parts.scheme in proxies and not proxy_bypass(parts.hostname):
+            return _proxied_get(url, data, proxies)
+            
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+            
+        method = 'GET'
+        # Use the same User-Agent as urlopen
+        headers = {'Accept-Encoding': 'gzip', 
+                   'User-Agent': 'Python-urllib/%i.%i' % sys.version_info[:2]}
+        if data is not None:
+            method = 'POST'
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            
+        for attempt in range(HTTP_RETRIES+1):
+            ## The first retry is immediate since the server may have just 
+            ## closed an idle connection, later ones back off
+            if attempt > 1:
+                time.sleep(HTTP_BACKOFF * 2**(attempt-2))
+                
+            conn = _http_connection(parts.scheme, parts.netloc, fresh=(attempt > 0))
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                ## Try again with a new connection
+                conn.close()
+                if attempt == HTTP_RETRIES:
+                    raise
+                continue
+            except (http.client.HTTPException, OSError):
+                ## Anything else, including a timeout, is not retried
+                conn.close()
+                raise
+                
+            if response.status < 500 or attempt == HTTP_RETRIES:
+                break
+                
+        if response.status in (301, 302, 303, 307, 308) and response.getheader('Location'):
+            url = urljoin(url, response.getheader('Location'))
+            if response.status in (301, 302, 303):
+                data = None
+            continue
+        break
+    else:
+        raise HTTPError(url, response.status, 'Too many redirects', response.headers, None)
+        
+    if response.status >= 400:
+        raise HTTPError(url, response.status, response.reason, response.headers, None)
+    if response.getheader('Content-Encoding', '') == 'gzip':
+        body = gzip.decompress(body)
+    return body
+
+
+# Location and lifetime (in s) of the on-disk cache of query results.  Each
+# response is kept in its own file that is named for a hash of the query.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'calibratorSearch')
+CACHE_LIFETIME = 7*86400
+
+_CACHE_LOCK = threading.Lock()
+_CACHE_PRUNED = False
+
+
+def _prune_cache():
+    """
+    Remove any files in the on-disk cache that are older than CACHE_LIFETIME.
+    """
+    
+    now = time.time()
+    try:
+        entries = list(os.scandir(CACHE_DIR))
+    except OSError:
+        return
+        
+    for entry in entries:
+        try:
+            if entry.is_file() and now - entry.stat().st_mtime >= CACHE_LIFETIME:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _cached_urlopen(url, data=None, parse=None):
+    """
+    Wrapper around _http_get that keeps a copy of the response on disk for
+    CACHE_LIFETIME seconds so that repeated queries, including those from 
+    earlier sessions, do not need to go back out to the network.  Returns 
+    the body of the response as bytes or, if a parse function is provided, 
+    the result of calling it on the body.
+    
+    A response is only saved if parse succeeds.  Errors from the query or 
+    from parse, including _NoMatch for a lookup that found nothing, are 
+    raised rather than caught.  Neither this cache nor the lru_cache on 
+    the query methods that call it then remembers a failed lookup.
+    """
+    
+    global _CACHE_PRUNED
+    
+    key = url
+    if data is not None:
+        key += '|' + data.decode()
+    cache_name = os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest())
+    
+    if parse is None:
+        parse = lambda body: body
+        
+    # Try the cache
+    try:
+        if time.time() - os.path.getmtime(cache_name) < CACHE_LIFETIME:
+            with open(cache_name, 'rb') as fh:
+                body = fh.read()
+            return parse(body)
+    except OSError:
+        pass
+        
+    # Query, parse, and save
+    body = _http_get(url, data)
+    result = parse(body)
+    
+    with _CACHE_LOCK:
+        prune, _CACHE_PRUNED = not _CACHE_PRUNED, True
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        
+        ## Drop expired entries the first time we write so that the cache 
+        ## does not keep growing from run to run
+        if prune:
+            _prune_cache()
+            
+        ## Write to a temporary file and move it into place so that other 
+        ## threads never see a partial entry
+        fd, temp_name = tempfile.mkstemp(prefix='.tmp', dir=CACHE_DIR)
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(body)
+            os.replace(temp_name, cache_name)
+        except OSError:
+            os.unlink(temp_name)
+            raise
+    except OSError:
+        pass
+        
+    return result
+
+
+# Radio catalogs to use for naming sources and their preference (higher is 
+# better)
+RADIO_CATALOG_RANKS = {'3C': 5, '4C': 4, 'TXS': 3, 'VLSS': 2, 'NVSS': 1}
+RADIO_CATALOG_RE = re.compile('^(%s)' % '|'.join(RADIO_CATALOG_RANKS))
+
+
+def _catalog_rank(name):
+    """
+    Return the rank of a source name based on which radio catalog it comes 
+    from.  Returns -1 if the name is not from a preferred catalog.
+    """
+    
+    mtch = RADIO_CATALOG_RE.match(name)
+    if mtch is None:
+        return -1
+    return RADIO_CATALOG_RANKS[mtch.group(1)]
+
+
 ID_QUIT = 101
 ID_RESOLVE = 201
 ID_SEARCH = 202
@@ -69,12 +380,25 @@ ID_DISPLAY = 204
 ID_ABOUT = 301
 
 class CalibratorSearch(wx.Frame):
+    # Icon for the 'about' window, loaded the first time it is needed
+    _aboutIcon = None
+    
     def __init__(self, parent, title, target=None, ra=None, dec=None):
         wx.Frame.__init__(self, parent, title=title, size=(725, 575))
         
         self.scriptPath = os.path.abspath(__file__)
         self.scriptPath = os.path.split(self.scriptPath)[0]
         
+        self._viewer = None
+        
+        # Worker threads for the network queries.  These are shared so that 
+        # the threads, and their connections to the servers, persist 
+        # between searches.
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self._prefetches = []
+        self._lookups = []
+        self._searching = False
+        
         self.initUI()
         self.initEvents()
         self.Show()
@@ -230,6 +554,12 @@ class CalibratorSearch(wx.Frame):
         size[1] = 225
         self.listControl.SetMinSize(size)
         self.listControl.Fit()
+        ### Fonts for flagging warnings and errors in the candidate list
+        self.fontW = wx.SystemSettings.GetFont(wx.SYS_SYSTEM_FONT)
+        self.fontW.SetStyle(wx.ITALIC)
+        self.fontE = wx.SystemSettings.GetFont(wx.SYS_SYSTEM_FONT)
+        self.fontE.SetStyle(wx.ITALIC)
+        self.fontE.SetWeight(wx.BOLD)
         sizer3.Add(lbl, pos=(row+0, 0), span=(1, 7), flag=wx.ALIGN_CENTER, border=5)
         sizer3.Add(self.listControl, pos=(row+1, 0), span=(8,7), flag=wx.EXPAND|wx.ALIGN_CENTER, border=5)
         
@@ -288,13 +618,26 @@ class CalibratorSearch(wx.Frame):
         # Keyboard
         self.nameText.Bind(wx.EVT_KEY_UP, self.onKeyPress)
         
+    def _setStatusText(self, text):
+        """
+        Set the status bar text.  This is safe to call from the worker threads
+        since the update is passed to the GUI thread via wx.CallAfter.
+        """
+        
+        if not wx.IsMainThread():
+            wx.CallAfter(self._setStatusText, text)
+            return
+            
+        # The window may have been closed while the update was pending
+        if self:
+            self.statusbar.SetStatusText(text, 0)
+            
     def _clearCandidates(self):
         """
         Clear everything out of the candidates list.
         """
         
-        for i in range(self.listControl.GetItemCount()):
-            self.listControl.DeleteItem(0)
+        self.listControl.DeleteAllItems()
             
     def onResolve(self, event):
         """
@@ -304,96 +647,145 @@ class CalibratorSearch(wx.Frame):
         source = self.nameText.GetValue()
         
         if source != '':
-            try:
-                result = urlopen(f"https://cdsweb.u-strasbg.fr/cgi-bin/nph-sesame/-oxp/SNV?{quote_plus(source)}")
-                tree = ElementTree.fromstring(result.read())
+            def parse(result):
+                tree = ElementTree.fromstring(result)
                 target = tree.find('Target')
                 service = target.find('Resolver')
                 coords = service.find('jpos')
                 
                 service = service.attrib['name'].split('=', 1)[1]
                 raS, decS = coords.text.split(None, 1)
+                return raS, decS
+                
+            try:
+                raS, decS = _cached_urlopen(f"https://cdsweb.u-strasbg.fr/cgi-bin/nph-sesame/-oxp/SNV?{quote_plus(source)}", parse=parse)
                 
                 self.raText.SetValue(raS)
                 self.decText.SetValue(decS)
                 
                 self._clearCandidates()
                 
-            except (IOError, IndexError, AttributeError, ElementTree.ParseError) as error:
+            except (IOError, EOFError, ValueError, IndexError, AttributeError, ElementTree.ParseError, http.client.HTTPException) as error:
                 self.statusbar.SetStatusText(f"Error resolving source: {str(error)}", 0)
                 self.raText.SetValue("HH:MM:SS.SS")
                 self.decText.SetValue("sDD:MM:SS.S")
                 
-    def _reverseNameLookup(self, ra, dec, radius_arcsec=15.0):
+    def _reverseNameLookup(self, ra, dec):
         """
         Perform a reverse name lookup (coordinates to name) via Simbad and return 
         the name of the source.  Returns '---' if no name can be found.
-        """
         
-        final_name = '---'
+        This is called from worker threads by onSearch so any updates to the
+        GUI need to go through wx.CallAfter.
+        """
         
         try:
-            result = urlopen('https://simbad.u-strasbg.fr/simbad/sim-coo?Coord=%s&CooFrame=FK5&CooEpoch=%s&CooEqui=%s&CooDefinedFrames=none&Radius=%f&Radius.unit=arcsec&submit=submit%%20query&CoordList=&list.idopt=CATLIST&list.idcat=3C%%2C4C%%2CVLSS%%2CNVSS%%2CTXS&output.format=VOTable' % (quote_plus('%s %s' % (ra, dec)), 2000.0, 2000.0, radius_arcsec))
-            tree = ElementTree.fromstring(result.read())
-            namespaces = {'VO': 'http://www.ivoa.net/xml/VOTable/v1.2'}
-            resource = tree.find('VO:RESOURCE', namespaces=namespaces)
-            table = resource.find('VO:TABLE', namespaces=namespaces)
+            final_name = self._simbadNameQuery(ra, dec)
+        except _NoMatch:
+            final_name = '---'
+        except (IOError, EOFError, ValueError, IndexError, AttributeError, TypeError, ElementTree.ParseError, http.client.HTTPException) as error:
+            self._setStatusText(f"Error during name lookup: {str(error)}")
+            final_name = '---'
             
-            rank = -1
-            
-            fields = []
-            for f in table.findall('VO:FIELD', namespaces=namespaces):
-                fields.append(f.attrib['ID'])
-            data = table.find('VO:DATA', namespaces=namespaces)
-            tabledata = data.find('VO:TABLEDATA', namespaces=namespaces)
-            for row in tabledata.findall('VO:TR', namespaces=namespaces):
-                entry = {}
-                for name,col in zip(fields, row.findall('VO:TD', namespaces=namespaces)):
-                    entry[name] = col.text
-                entry_rank = int(entry['NB_REF'], 10)
-                
-                if entry_rank > rank:
-                    final_name = SIMBAD_REF_RE.sub('', entry['MAIN_ID'])
-                    rank = entry_rank
-        except (IOError, ValueError, AttributeError, ElementTree.ParseError) as error:
-            self.statusbar.SetStatusText(f"Error during name lookup: {str(error)}", 0)
-            
-        if final_name == '---':
-            # Try with a bigger search area
-            final_name = self._reverseNameLookup(ra, dec, radius_arcsec=2*radius_arcsec)
-        else:
+        if final_name != '---':
             # Try to get a "better" name for the source
             final_name = self._radioNameQuery(final_name)
             
         return final_name
         
-    @lru_cache(maxsize=64)
-    def _radioNameQuery(self, name):
-        final_name = name
+    @lru_cache(maxsize=1024)
+    def _simbadNameQuery(self, ra, dec):
+        """
+        Query Simbad for the sources near a position and return the name of 
+        the best studied one within the smallest of the SIMBAD_RADII that has 
+        any sources.  Raises _NoMatch if there are no sources.
+        """
         
-        preferred_order = {'3C':5, '4C':4, 'TXS':3, 'VLSS':2, 'NVSS': 1}
+        ra0 = _to_degrees(ra, hours=True)
+        dec0 = _to_degrees(dec)
         
-        rank = -1
-        for catalog in preferred_order.keys():
-            if name.startswith(catalog):
-                if preferred_order[catalog] > rank:
-                    rank = preferred_order[catalog]
+        def parse(result):
+            tree = ElementTree.fromstring(result)
+            
+            fields, ucds = [], []
+            for f in tree.findall('VO:RESOURCE/VO:TABLE/VO:FIELD', namespaces=VOTABLE_NS):
+                fields.append(f.attrib['ID'])
+                ucds.append(f.attrib.get('ucd', ''))
+            main_id_idx = fields.index('MAIN_ID')
+            nb_ref_idx = fields.index('NB_REF')
+            ## The main position columns
+            ra_idx = ucds.index('pos.eq.ra;meta.main') if 'pos.eq.ra;meta.main' in ucds else fields.index('RA')
+            dec_idx = ucds.index('pos.eq.dec;meta.main') if 'pos.eq.dec;meta.main' in ucds else fields.index('DEC')
+            
+            entries = []
+            for row in tree.findall('VO:RESOURCE/VO:TABLE/VO:DATA/VO:TABLEDATA/VO:TR', namespaces=VOTABLE_NS):
+                ## The cells are the only children of a row
+                cols = list(row)
+                entry_rank = int(cols[nb_ref_idx].text, 10)
+                
+                ## Sources without a usable position only count at the 
+                ## largest radius
+                try:
+                    sep = _separation(ra0, dec0, 
+                                      _to_degrees(cols[ra_idx].text, hours=True), 
+                                      _to_degrees(cols[dec_idx].text))
+                except (AttributeError, IndexError, ValueError):
+                    sep = SIMBAD_RADII[-1]
+                entries.append((sep, entry_rank, cols[main_id_idx].text))
+                
+            for radius in SIMBAD_RADII:
+                final_name = '---'
+                rank = -1
+                for sep,entry_rank,name in entries:
+                    if sep <= radius and entry_rank > rank:
+                        final_name = name
+                        rank = entry_rank
+                        
+                if rank >= 0:
+                    return SIMBAD_REF_RE.sub('', final_name)
                     
+            raise _NoMatch(f"No sources found near {ra} {dec}")
+            
+        return _cached_urlopen('https://simbad.u-strasbg.fr/simbad/sim-coo?Coord=%s&CooFrame=FK5&CooEpoch=%s&CooEqui=%s&CooDefinedFrames=none&Radius=%f&Radius.unit=arcsec&submit=submit%%20query&CoordList=&list.idopt=CATLIST&list.idcat=3C%%2C4C%%2CVLSS%%2CNVSS%%2CTXS&output.format=VOTable' % (quote_plus('%s %s' % (ra, dec)), 2000.0, 2000.0, SIMBAD_RADII[-1]), parse=parse)
+        
+    def _radioNameQuery(self, name):
+        """
+        Look for an alias of a source in one of the preferred radio catalogs via
+        Sesame.  Returns the original name if no better one can be found.
+        """
+        
         try:
-            result = urlopen(f"https://cdsweb.u-strasbg.fr/cgi-bin/nph-sesame/-oxpI/SNV?{quote_plus(name)}")
-            tree = ElementTree.fromstring(result.read())
+            final_name = self._sesameAliasQuery(name)
+        except (IOError, EOFError, ValueError, AttributeError, TypeError, ElementTree.ParseError, http.client.HTTPException) as error:
+            self._setStatusText(f"Error during radio name lookup: {str(error)}")
+            final_name = name
+            
+        return final_name
+        
+    @lru_cache(maxsize=64)
+    def _sesameAliasQuery(self, name):
+        """
+        Query Sesame for the aliases of a source and return the one from the 
+        most preferred radio catalog.
+        """
+        
+        def parse(result):
+            final_name = name
+            
+            rank = _catalog_rank(name)
+            
+            tree = ElementTree.fromstring(result)
             target = tree.find('Target')
             service = target.find('Resolver')
             for alias in service.findall('alias'):
-                for catalog in preferred_order.keys():
-                    if alias.text.startswith(catalog):
-                        if preferred_order[catalog] > rank:
-                            final_name = alias.text
-                            rank = preferred_order[catalog]
-        except (IOError, ValueError, AttributeError, ElementTree.ParseError) as error:
-            self.statusbar.SetStatusText(f"Error during radio name lookup: {str(error)}", 0)
+                alias_rank = _catalog_rank(alias.text)
+                if alias_rank > rank:
+                    final_name = alias.text
+                    rank = alias_rank
+                    
+            return final_name
             
-        return final_name
+        return _cached_urlopen(f"https://cdsweb.u-strasbg.fr/cgi-bin/nph-sesame/-oxpI/SNV?{quote_plus(name)}", parse=parse)
         
     def onSearch(self, event):
         """
@@ -401,14 +793,15 @@ class CalibratorSearch(wx.Frame):
         provided, and update the candidate list.
         """
         
+        # Only run one search at a time
+        if self._searching:
+            return False
+            
         # Load in the values
         ## Coodinates
         ra = self.raText.GetValue()
         dec = self.decText.GetValue()
-        try:
-            ephem.hours(str(ra))
-            ephem.degrees(str(dec))
-        except (ValueError, TypeError):
+        if not (RA_RE.match(ra) and DEC_RE.match(dec)):
             return False
         ## Search criteria
         flux = float(self.fdText.GetValue())
@@ -420,119 +813,182 @@ class CalibratorSearch(wx.Frame):
             self.udText.SetValue(f"{max_dist:.1f}")
             self.udText.Refresh()
             
+        # Drop any image prefetches from the last search that have not 
+        # started yet so that they do not hold up the name lookups
+        for prefetch in self._prefetches:
+            prefetch.cancel()
+        self._prefetches = []
+        
+        # Run the search in the background so that the GUI stays responsive
+        self._searching = True
         wx.BeginBusyCursor()
+        searcher = threading.Thread(target=self._searchWorker, args=(ra, dec, flux, min_dist, max_dist))
+        searcher.daemon = True
+        searcher.start()
         
-        # Find the candidates
-        ## Query the candidates
-        data = urlencode({'Equinox': 3, 
-                          'DecFit': 0, 
-                          'FluxDensity': flux,  
-                          'ObjName': '', 
-                          'RA': ra.replace(':', ' '), 
-                          'Dec': dec.replace(':', ' '), 
-                          'searchrad': max_dist*3600, 
-                          'verhalf': 12*60, 
-                          'poslist': ''})
+    def _searchWorker(self, ra, dec, flux, min_dist, max_dist):
+        """
+        Query the VLSSr for sources around the target position and find names
+        for them.  This runs in its own thread and hands the candidates off 
+        to _populateCandidates when it is done.
+        """
         
+        # Find the candidates.  The list is always handed back, even if 
+        # something unexpected goes wrong, so that the search is marked as 
+        # finished.
         candidates = []
         try:
-            result = urlopen('https://www.cv.nrao.edu/cgi-bin/newVLSSlist.pl', data.encode())
-            lines = result.readlines()
-            
-            ## Parse
-            inside = False
-            for line in lines:
-                line = line.decode()
-                line = line.rstrip()
-                if line.find('h  m    s    d  m   s   Ori      Jy') != -1:
-                    inside = True
-                elif line.find('Found') != -1 and inside:
-                    inside = False
-                elif inside:
-                    fields = line.split(None, 13)
-                    if len(fields) < 14:
-                        continue
-                    ra = ':'.join(fields[0:3])
-                    dec = ':'.join(fields[3:6])
-                    sep = float(fields[6]) / 3600.0
-                    flux = float(fields[7])
-                    maj, min, pa = fields[8], fields[9], fields[10]
-                    if sep < min_dist:
-                        continue
-                    name = self._reverseNameLookup(ra, dec)
-                    candidates.append( (name,ra,dec,sep,flux,maj,min,pa) )
-                    
-        except (IOError, ValueError, RuntimeError) as error:
-            self.statusbar.SetStatusText(f"Error during search: {str(error)}", 0)
+            ## Query the candidates
+            data = urlencode({'Equinox': 3, 
+                              'DecFit': 0, 
+                              'FluxDensity': flux,  
+                              'ObjName': '', 
+                              'RA': ra.replace(':', ' '), 
+                              'Dec': dec.replace(':', ' '), 
+                              'searchrad': max_dist*3600, 
+                              'verhalf': 12*60, 
+                              'poslist': ''})
             
-        ## Update the status bar
+            parsed = []
+            try:
+                body = _http_get('https://www.cv.nrao.edu/cgi-bin/newVLSSlist.pl', data.encode())
+                
+                ## Find the table of sources
+                start = body.find(VLSSR_LIST_HEADER)
+                if start != -1:
+                    start = body.find(b'\n', start) + 1
+                    if start == 0:
+                        start = len(body)
+                    stop = body.find(VLSSR_LIST_FOOTER, start)
+                    if stop == -1:
+                        stop = len(body)
+                    else:
+                        stop = body.rfind(b'\n', start, stop) + 1
+                        
+                    ## Parse - rows that are too short to be sources are skipped
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        table = numpy.genfromtxt(BytesIO(body[start:max(start, stop)]), 
+                                                 dtype=VLSSR_LIST_DTYPE, comments=None, 
+                                                 usecols=range(len(VLSSR_LIST_DTYPE)), 
+                                                 invalid_raise=False, encoding='ascii')
+                    table = numpy.atleast_1d(table)
+                    table = table[table['sep']/3600.0 >= min_dist]
+                    for rah,ram,ras,decd,decm,decs,sep,flux,maj,min,pa in table.tolist():
+                        ra = ':'.join((rah,ram,ras))
+                        dec = ':'.join((decd,decm,decs))
+                        parsed.append( (ra,dec,sep/3600.0,flux,maj,min,pa) )
+                        
+            except (IOError, EOFError, ValueError, RuntimeError, http.client.HTTPException) as error:
+                self._setStatusText(f"Error during search: {str(error)}")
+                
+            ## Find names for the candidates - the lookups are independent and
+            ## dominated by network latency so run them concurrently.  They 
+            ## are kept so that onQuit can cancel any that have not started.
+            self._lookups = lookups = []
+            try:
+                for c in parsed:
+                    lookups.append(self._executor.submit(self._reverseNameLookup, c[0], c[1]))
+                names = [lookup.result() for lookup in lookups]
+                candidates = [(name,)+c for name,c in zip(names, parsed)]
+            except (CancelledError, RuntimeError):
+                ### The window was closed during the search
+                pass
+        finally:
+            wx.CallAfter(self._populateCandidates, candidates)
+            
+    def _populateCandidates(self, candidates):
+        """
+        Update the candidate list with the results of a search.
+        """
+        
+        self._searching = False
+        wx.EndBusyCursor()
+        
+        # The window may have been closed while the search was running
+        if not self:
+            return
+            
+        # Update the status bar
         if len(candidates) == 0:
             self.statusbar.SetStatusText('No candidates found matching the search criteria', 0)
         else:
             self.statusbar.SetStatusText(f"Found {len(candidates)} candidates matching the search criteria", 0)
             
-        ## Sort by distance from the target
+        # Sort by distance from the target
         candidates.sort(key=lambda x:x[3])
         
-        wx.EndBusyCursor()
-        
-        fontW = wx.SystemSettings.GetFont(wx.SYS_SYSTEM_FONT)
-        fontW.SetStyle(wx.ITALIC)
-        fontE = wx.SystemSettings.GetFont(wx.SYS_SYSTEM_FONT)
-        fontE.SetStyle(wx.ITALIC)
-        fontE.SetWeight(wx.BOLD)
-        
         # Update the candidate list in the window
         self._clearCandidates()
-        for i,candidate in enumerate(candidates):
-            name,ra,dec,sep,flux,maj,min,pa = candidate
-            index = InsertListItem(self.listControl, i, name)
-            
-            SetListItem(self.listControl, index, 1, ra)
-            SetListItem(self.listControl, index, 2, dec)
-            SetListItem(self.listControl, index, 3, f"{sep:.1f}")
-            SetListItem(self.listControl, index, 4, f"{flux:.1f}")
-            SetListItem(self.listControl, index, 5, f"{maj}\" by {min}\" @ {pa}")
-            
-            ## Flag things that look like they might be too far away
-            if sep >= 3.5:
-                item = self.listControl.GetItem(index, 3)
-                self.listControl.SetItemTextColour(item.GetId(), wx.RED)
-                self.listControl.SetItemFont(item.GetId(), fontE)
-                self.listControl.RefreshItem(item.GetId())
-            elif sep > 3.0:
-                item = self.listControl.GetItem(index, 3)
-                self.listControl.SetItemTextColour(item.GetId(), ORANGE)
-                self.listControl.SetItemFont(item.GetId(), fontW)
-                self.listControl.RefreshItem(item.GetId())
+        self.listControl.Freeze()
+        try:
+            for i,candidate in enumerate(candidates):
+                name,ra,dec,sep,flux,maj,min,pa = candidate
+                index = InsertListItem(self.listControl, i, name)
                 
-            ## Flag things that look like they might be too faint
-            if flux < 5.0:
-                item = self.listControl.GetItem(index, 4)
-                self.listControl.SetItemFont(item.GetId(), fontE)
-                self.listControl.RefreshItem(item.GetId())
+                SetListItem(self.listControl, index, 1, ra)
+                SetListItem(self.listControl, index, 2, dec)
+                SetListItem(self.listControl, index, 3, f"{sep:.1f}")
+                SetListItem(self.listControl, index, 4, f"{flux:.1f}")
+                SetListItem(self.listControl, index, 5, f"{maj}\" by {min}\" @ {pa}")
                 
-            ## Flag things that look like they might be too large
-            try:
-                maj = float(maj)
-                if maj >= 40.0:
-                    item = self.listControl.GetItem(index, 5)
-                    self.listControl.SetItemTextColour(item.GetId(), wx.RED)
-                    self.listControl.SetItemFont(item.GetId(), fontE)
-                    self.listControl.RefreshItem(item.GetId())
-            except ValueError:
-                pass
+                ## Flag things that look like they might be too far away
+                if sep >= 3.5:
+                    self.listControl.SetItemTextColour(index, wx.RED)
+                    self.listControl.SetItemFont(index, self.fontE)
+                elif sep > 3.0:
+                    self.listControl.SetItemTextColour(index, ORANGE)
+                    self.listControl.SetItemFont(index, self.fontW)
+                
+                ## Flag things that look like they might be too faint
+                if flux < 5.0:
+                    self.listControl.SetItemFont(index, self.fontE)
                 
-    @lru_cache(maxsize=4)
+                ## Flag things that look like they might be too large
+                try:
+                    maj = float(maj)
+                    if maj >= 40.0:
+                        self.listControl.SetItemTextColour(index, wx.RED)
+                        self.listControl.SetItemFont(index, self.fontE)
+                except ValueError:
+                    pass
+        finally:
+            self.listControl.Thaw()
+            
+        # Start loading the images of the closest candidates while the user 
+        # looks over the list
+        try:
+            sz = float(self.szText.GetValue())
+        except ValueError:
+            sz = 0.5
+        self._prefetches = [self._executor.submit(self._fetchVLSSrImage, candidate[1], candidate[2], size=sz) for candidate in candidates[:8]]
+            
     def _loadVLSSrImage(self, ra, dec, size=0.5):
         """
         Given an RA and declination string, query the VLSSr postage stamp server
-        and return a header/image for those coordinates.
+        and return a header/image for those coordinates.  If the image cannot 
+        be loaded the image returned is None.
         """
         
         header = {}
         image = None
         
+        try:
+            header, image = self._fetchVLSSrImage(ra, dec, size=size)
+        except (IOError, EOFError, ValueError, TypeError, RuntimeError, http.client.HTTPException) as error:
+            self._setStatusText(f"Error loading image: {str(error)}")
+            
+        return header, image
+        
+    @lru_cache(maxsize=16)
+    def _fetchVLSSrImage(self, ra, dec, size=0.5):
+        """
+        Query the VLSSr postage stamp server and return the header/image for 
+        the given coordinates.
+        """
+        
+        import astropy.io.fits as astrofits
+        
         data = urlencode({'Equinox': 2, 
                           'ObjName': '', 
                           'RA': ra.replace(':', ' '), 
@@ -542,22 +998,14 @@ class CalibratorSearch(wx.Frame):
                           'MAPROG': 'SIN',
                           'rotate': 0.0,  
                           'Type': 'image/x-fits'})
-        with NamedTemporaryFile(suffix='.fits', prefix='vlssr-') as th:
-            try:
-                result = urlopen('https://www.cv.nrao.edu/cgi-bin/newVLSSpostage.pl', data.encode())
-                th.write(result.read())
-                th.flush()
-                th.seek(0)
-                
-                hdulist = astrofits.open(th.name, 'readonly')
-                for key in hdulist[0].header:
-                    header[key] = hdulist[0].header[key]
-                image = hdulist[0].data[0,0,:,:]
-                hdulist.close()
-            except (IOError, ValueError, RuntimeError) as error:
-                self.statusbar.SetStatusText(f"Error loading image: {str(error)}", 0)
-                
-        return header, image
+        def parse(result):
+            hdulist = astrofits.open(BytesIO(result), 'readonly', memmap=False)
+            header = hdulist[0].header
+            image = numpy.ascontiguousarray(hdulist[0].data[0,0,:,:], dtype=numpy.float32)
+            hdulist.close()
+            return header, image
+            
+        return _cached_urlopen('https://www.cv.nrao.edu/cgi-bin/newVLSSpostage.pl', data.encode(), parse=parse)
         
     def onDisplay(self, event):
         """
@@ -580,11 +1028,41 @@ class CalibratorSearch(wx.Frame):
                 self.statusbar.SetStatusText(f"Error displaying image: {str(error)}", 0)
                 sz = 0.5
             
+            # Load the image in the background so that the GUI stays responsive
             wx.BeginBusyCursor()
-            header, image = self._loadVLSSrImage(ra, dec, size=sz)
-            wx.EndBusyCursor()
+            loader = threading.Thread(target=self._displayWorker, args=(name, ra, dec, sz))
+            loader.daemon = True
+            loader.start()
             
-            ImageViewer(self, name, ra, dec, header, image)
+    def _displayWorker(self, name, ra, dec, size):
+        """
+        Load the VLSSr image for a candidate and hand it off to _showImage. 
+        This runs in its own thread.
+        """
+        
+        header, image = {}, None
+        try:
+            header, image = self._loadVLSSrImage(ra, dec, size=size)
+        finally:
+            wx.CallAfter(self._showImage, name, ra, dec, header, image)
+        
+    def _showImage(self, name, ra, dec, header, image):
+        """
+        Display a VLSSr image loaded by _displayWorker.
+        """
+        
+        wx.EndBusyCursor()
+        
+        # The window may have been closed while the image was loading
+        if not self:
+            return
+            
+        if image is not None:
+            if self._viewer:
+                ## Reuse the existing viewer if it is still open
+                self._viewer.setImage(name, ra, dec, header, image)
+            else:
+                self._viewer = ImageViewer(self, name, ra, dec, header, image)
             
     def onKeyPress(self, event):
         if event.GetKeyCode() == wx.WXK_RETURN:
@@ -597,7 +1075,9 @@ class CalibratorSearch(wx.Frame):
         
         dialog = wx.AboutDialogInfo()
         
-        dialog.SetIcon(wx.Icon(os.path.join(self.scriptPath, 'icons', 'lwa.png'), wx.BITMAP_TYPE_PNG))
+        if CalibratorSearch._aboutIcon is None:
+            CalibratorSearch._aboutIcon = wx.Icon(os.path.join(self.scriptPath, 'icons', 'lwa.png'), wx.BITMAP_TYPE_PNG)
+        dialog.SetIcon(CalibratorSearch._aboutIcon)
         dialog.SetName('VLSSr Calibrator Search')
         dialog.SetVersion(__version__)
         dialog.SetDescription("""GUI for searching the VLSSr (Lane et al., 2012 Radio Science v. 47, RS0K04) to find sources suitable for phase calibrators for the LWA single baseline interferometer.\n\nLSL Version: %s""" % lsl.version.version)
@@ -615,9 +1095,40 @@ class CalibratorSearch(wx.Frame):
         Quit the main window.
         """
         
+        # Drop any queued network work.  shutdown() leaves queued work in 
+        # place and the executor threads are joined at exit, so anything 
+        # left would hold up the exit.
+        for future in self._prefetches + self._lookups:
+            future.cancel()
+        self._executor.shutdown(wait=False)
         self.Destroy()
 
 
+class SkyFormatter(Formatter):
+    """
+    Matplotlib tick formatter that labels all of the ticks on an axis in one 
+    pass.  The labels are generated by a function that takes a collection of
+    tick locations and returns a list of labels.  The labels for the last set
+    of tick locations are kept so that redraws with the same ticks do not 
+    need to rebuild them.
+    """
+    
+    def __init__(self, func):
+        self.func = func
+        self._values = None
+        self._labels = None
+        
+    def __call__(self, x, pos=None):
+        return self.func([x,])[0]
+        
+    def format_ticks(self, values):
+        values = tuple(values)
+        if values != self._values:
+            self._labels = self.func(values)
+            self._values = values
+        return list(self._labels)
+
+
 class ImageViewer(wx.Frame):
     def __init__(self, parent, name, ra, dec, header, image):
         wx.Frame.__init__(self, parent, title='VLSSr Field', size=(800, 375))
@@ -629,11 +1140,13 @@ class ImageViewer(wx.Frame):
         self.header = header
         self.image = image
         
+        self._resizeTimer = None
+        self._motion_scheduled = False
+        
         self.initUI()
         self.initEvents()
         self.Show()
         
-        self._state = {}
         self.initPlot()
             
     def initUI(self):
@@ -641,6 +1154,9 @@ class ImageViewer(wx.Frame):
         Start the user interface.
         """
         
+        from matplotlib.backends.backend_wxagg import NavigationToolbar2WxAgg, FigureCanvasWxAgg
+        from matplotlib.figure import Figure
+        
         self.statusbar = self.CreateStatusBar()
         
         hbox = wx.BoxSizer(wx.HORIZONTAL)
@@ -648,10 +1164,13 @@ class ImageViewer(wx.Frame):
         # Add plots to panel 1
         panel = wx.Panel(self, -1)
         vbox1 = wx.BoxSizer(wx.VERTICAL)
-        self.figure = Figure()
+        self.figure = Figure(constrained_layout=True)
+        self._invDpi = 1.0 / self.figure.get_dpi()
+        self._figureSize = None
         self.canvas = FigureCanvasWxAgg(panel, -1, self.figure)
         self.toolbar = NavigationToolbar2WxAgg(self.canvas)
         self.toolbar.Realize()
+        self._toolbarHeight = self.toolbar.GetSize()[1]
         vbox1.Add(self.canvas,  1, wx.ALIGN_LEFT | wx.EXPAND)
         vbox1.Add(self.toolbar, 0, wx.ALIGN_LEFT)
         panel.SetSizer(vbox1)
@@ -668,108 +1187,158 @@ class ImageViewer(wx.Frame):
         """
         
         # Make the images resizable
-        self.Bind(wx.EVT_PAINT, self.resizePlots)
+        self.Bind(wx.EVT_SIZE, self.resizePlots)
+        self.toolbar.Bind(wx.EVT_SIZE, self.onToolbarSize)
         
-    def _sin_px_to_sky(self, x, y):
+        # Clean up when the window is closed
+        self.Bind(wx.EVT_CLOSE, self.onClose)
+        
+    def _px_to_sky(self, x, y):
         """
-        Convert pixel coordinates to sky coordinates for a simple SIN projection.
+        Convert pixel coordinates to sky coordinates in degrees using the WCS 
+        of the image.  The pixel coordinates can be scalars or arrays that 
+        broadcast against each other.
+        """
+        
+        x, y = numpy.broadcast_arrays(x, y)
+        return self._wcs.wcs_pix2world(x, y, 0)
+        
+    @staticmethod
+    def _to_sexagesimal(value, precision=0):
+        """
+        Split a non-negative value into whole units, minutes, and seconds with 
+        the seconds rounded to the given number of decimal places.  Returns a 
+        three-element tuple of (units, minutes, seconds).
+        """
+        
+        scale = 10**precision
+        total = int(round(value*3600*scale))
+        u, s = divmod(total, 3600*scale)
+        m, s = divmod(s, 60*scale)
+        return u, m, s/scale
+        
+    def _ra_ticks(self, locs):
+        """
+        Build the RA tick labels for a collection of x pixel locations.
         """
-    
-        x = (x - (self.header['CRPIX1']-1))*self.header['CDELT1'] * numpy.pi/180
-        y = (y - (self.header['CRPIX2']-1))*self.header['CDELT2'] * numpy.pi/180
-        rho = numpy.sqrt(x*x + y*y)
-        c = numpy.arcsin(rho)
-        sc = numpy.sin(c)
-        cc = numpy.cos(c)
-        ra0 = self.header['CRVAL1'] * numpy.pi/180
-        dec0 = self.header['CRVAL2'] * numpy.pi/180
-        ra = ra0 \
-             + numpy.arctan2(x*sc, rho*cc*numpy.cos(dec0) - y*sc*numpy.sin(dec0))
-        if rho > 1e-10:
-            dec = numpy.arcsin(cc*numpy.sin(dec0) + y*sc*numpy.cos(dec0)/rho)
-        else:
-            dec = dec0
-        return ra*180/numpy.pi, dec*180/numpy.pi
         
-    def _ra_ticks(self, t, tick_number):
-        try:
-            oh, om, os = self._state['ra_tick']
-        except KeyError:
-            oh, om, os = -99, -99, -99
-            
-        conv = lambda x: self._sin_px_to_sky(x, 0)[0]
         units = ('$^h$', '$^m$', '$^s$')
         
-        value = conv(t) / 15.0
-        value = value % 24.0
-        h = int(value)
-        m = int((value - h)*60) % 60
-        s = int(value*3600) % 60.0
+        ## Convert the ticks directly so that locations off the edge of the
+        ## image and across RA = 0 are labelled correctly
+        values = self._px_to_sky(numpy.asarray(locs, dtype=numpy.float64), 0)[0] / 15.0
+        values = values % 24.0
         
-        if tick_number == 1 or h != oh:
-            label = "%i%s%02i%s%02.0f%s" % (h, units[0], m, units[1], s, units[2])
-        elif m != om:
-            label = "%02i%s%02.0f%s" % (m, units[1], s, units[2])
-        else:
-            label = "%02.0f%s" % (s, units[2])
+        labels = []
+        oh, om = -99, -99
+        for tick_number,value in enumerate(values):
+            h, m, s = self._to_sexagesimal(value)
+            h %= 24
+            
+            if tick_number == 1 or h != oh:
+                label = "%i%s%02i%s%02.0f%s" % (h, units[0], m, units[1], s, units[2])
+            elif m != om:
+                label = "%02i%s%02.0f%s" % (m, units[1], s, units[2])
+            else:
+                label = "%02.0f%s" % (s, units[2])
+            labels.append(label)
             
-        self._state['ra_tick'] = (h, m, s)
+            oh, om = h, m
+            
+        return labels
         
-        return label
+    def _dec_ticks(self, locs):
+        """
+        Build the declination tick labels for a collection of y pixel locations.
+        """
         
-    def _dec_ticks(self, t, tick_number):
-        try:
-            og, od, om, os = self._state['dec_tick']
-        except KeyError:
-            og, od, om, os = '&', -99, -99, -99
-            
-        conv = lambda y: self._sin_px_to_sky(0, y)[1]
         units = ('$^\\circ$', "'", '"')
         
-        value = conv(t)
-        g = '+' if value >= 0 else '-'
-        value = abs(value)
-        d = int(value)
-        m = int((value - d)*60) % 60
-        s = int(value*3600) % 60.0
-        
-        if tick_number == 1 or d != od or g != og:
-            label = "%s%i%s%02i%s%02.0f%s" % (g, d, units[0], m, units[1], s, units[2])
-        elif m != om:
-            label = "%02i%s%02.0f%s" % (m, units[1], s, units[2])
-        else:
-            label = "%02.0f%s" % (s, units[2])
-            
-        self._state['dec_tick'] = (g, d, m, s)
+        values = self._px_to_sky(0, numpy.asarray(locs, dtype=numpy.float64))[1]
         
-        return label
+        labels = []
+        og, od, om = '&', -99, -99
+        for tick_number,value in enumerate(values):
+            g = '+' if value >= 0 else '-'
+            d, m, s = self._to_sexagesimal(abs(value))
+            
+            if tick_number == 1 or d != od or g != og:
+                label = "%s%i%s%02i%s%02.0f%s" % (g, d, units[0], m, units[1], s, units[2])
+            elif m != om:
+                label = "%02i%s%02.0f%s" % (m, units[1], s, units[2])
+            else:
+                label = "%02.0f%s" % (s, units[2])
+            labels.append(label)
+            
+            og, od, om = g, d, m
+            
+        return labels
         
     def initPlot(self):
         """
         Setup the image.
         """
         
+        from astropy.wcs import WCS
+        
         self.figure.clf()
         self.ax1 = self.figure.gca()
         
+        # Build the celestial WCS for the image
+        self._wcs = WCS(naxis=2)
+        self._wcs.wcs.ctype = [self.header['CTYPE1'], self.header['CTYPE2']]
+        self._wcs.wcs.crpix = [self.header['CRPIX1'], self.header['CRPIX2']]
+        self._wcs.wcs.cdelt = [self.header['CDELT1'], self.header['CDELT2']]
+        self._wcs.wcs.crval = [self.header['CRVAL1'], self.header['CRVAL2']]
+        
+        # Save the largest valid pixel coordinates for on_motion and forget
+        # the last pixel/text reported
+        self._xmax = self.image.shape[1] - 1
+        self._ymax = self.image.shape[0] - 1
+        self._last_px = (-1, -1)
+        self._last_status = None
+        self._pending_xy = None
+        
+        # Pre-compute the sky coordinates of every pixel so that on_motion
+        # only needs to look them up
+        x_pixels = numpy.arange(self.image.shape[1])
+        y_pixels = numpy.arange(self.image.shape[0])
+        self._ra_table, self._dec_table = self._px_to_sky(x_pixels[numpy.newaxis,:],
+                                                          y_pixels[:,numpy.newaxis])
+        
         peak = self.image.max()
         vmin = -1
-        vmax = min([20.0, peak*0.5])
+        vmax = min(20.0, peak*0.5)
         
         c = self.ax1.imshow(self.image, origin='lower', interpolation='nearest', 
                             vmin=vmin, vmax=vmax, cmap='gist_yarg')
-        self.ax1.xaxis.set_major_formatter(FuncFormatter(self._ra_ticks))
-        self.ax1.yaxis.set_major_formatter(FuncFormatter(self._dec_ticks))
+        self.ax1.xaxis.set_major_formatter(SkyFormatter(self._ra_ticks))
+        self.ax1.yaxis.set_major_formatter(SkyFormatter(self._dec_ticks))
         self.ax1.set_xlabel('RA (J2000)')
         self.ax1.set_ylabel('Dec. (J2000)')
         self.ax1.set_title(f"{self.name}\nPeak: {peak:.1f} Jy/beam")
         cb = self.figure.colorbar(c, ax=self.ax1)
         cb.set_label('Jy/beam')
-        self.figure.tight_layout()
         
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.connect()
         
+    def setImage(self, name, ra, dec, header, image):
+        """
+        Replace the image being displayed.
+        """
+        
+        self.disconnect()
+        
+        self.name = name
+        self.ra = ra
+        self.dec = dec
+        self.header = header
+        self.image = image
+        
+        self.initPlot()
+        self.Raise()
+        
     def connect(self):
         """
         Connect to all the events we need to interact with the plots.
@@ -782,30 +1351,61 @@ class ImageViewer(wx.Frame):
         Deal with motion events in the stand field window.  This involves 
         setting the status bar with the current x and y coordinates as well
         as the stand number of the selected stand (if any).
+        
+        The status bar is updated once the events that are already waiting 
+        have been processed so that only the latest position of a burst of
+        motion is worked on.
+        """
+        
+        if event.inaxes is self.ax1:
+            self._pending_xy = (event.xdata, event.ydata)
+        else:
+            self._pending_xy = None
+            
+        if not self._motion_scheduled:
+            self._motion_scheduled = True
+            wx.CallAfter(self._updateStatus)
+            
+    def _updateStatus(self):
         """
+        Update the status bar with the sky position and value of the pixel 
+        under the cursor.
+        """
+        
+        self._motion_scheduled = False
         
-        if event.inaxes:
-            clickX = event.xdata
-            clickY = event.ydata
-            clickX = numpy.clip(int(round(clickX)), 0, self.image.shape[1]-1)
-            clickY = numpy.clip(int(round(clickY)), 0, self.image.shape[0]-1)
+        # The window may have been closed while the update was pending
+        if not self:
+            return
             
-            ra, dec = self._sin_px_to_sky(clickX, clickY)
+        if self._pending_xy is not None:
+            clickX, clickY = self._pending_xy
+            clickX = min(max(int(round(clickX)), 0), self._xmax)
+            clickY = min(max(int(round(clickY)), 0), self._ymax)
             
-            ra /= 15.0
-            rh = int(ra)
-            rm = int((ra - rh)*60) % 60
-            rs = (ra*3600) % 60.0
+            ## Nothing to do if we are still on the same pixel
+            if (clickX, clickY) == self._last_px:
+                return
+            self._last_px = (clickX, clickY)
+            
+            ra = self._ra_table.item(clickY, clickX)
+            dec = self._dec_table.item(clickY, clickX)
+            
+            rh, rm, rs = self._to_sexagesimal(ra/15.0, 2)
+            rh %= 24
             
             dg =  '-' if dec < 0 else '+'
-            dec = abs(dec)
-            dd = int(dec)
-            dm = int((dec - dd)*60) % 60
-            ds = (dec*3600) % 60.0
+            dd, dm, ds = self._to_sexagesimal(abs(dec), 1)
             
-            self.statusbar.SetStatusText("%i:%02i:%05.2f, %s%i:%02i:%04.1f @ %4.1f Jy" % (rh, rm, rs, dg, dd, dm, ds, self.image[clickY, clickX]))
+            text = f"{rh}:{rm:02d}:{rs:05.2f}, {dg}{dd}:{dm:02d}:{ds:04.1f} @ {self.image.item(clickY, clickX):4.1f} Jy"
         else:
-            self.statusbar.SetStatusText("")
+            self._last_px = (-1, -1)
+            text = ""
+            
+        ## Only update the status bar if the text has changed
+        if text != self._last_status:
+            self.statusbar.SetStatusText(text)
+            self._last_status = text
             
     def disconnect(self):
         """
@@ -814,17 +1414,54 @@ class ImageViewer(wx.Frame):
         
         self.figure.canvas.mpl_disconnect(self.cidmotion)
         
+    def onClose(self, event):
+        """
+        Stop the event handlers and any pending resize before the window is 
+        destroyed.
+        """
+        
+        self.disconnect()
+        self.Unbind(wx.EVT_SIZE)
+        if self._resizeTimer is not None:
+            self._resizeTimer.Stop()
+            self._resizeTimer = None
+            
+        event.Skip()
+        
     def resizePlots(self, event):
-        # Get the current size of the window and the navigation toolbar
+        event.Skip()
+        
+        # Wait for the window to stop changing size before updating the 
+        # figure so that a drag only leads to one new layout
+        if self._resizeTimer is not None and self._resizeTimer.IsRunning():
+            self._resizeTimer.Restart(50)
+        else:
+            self._resizeTimer = wx.CallLater(50, self._doResize)
+            
+    def onToolbarSize(self, event):
+        """
+        Keep track of the height of the navigation toolbar.
+        """
+        
+        self._toolbarHeight = event.GetSize()[1]
+        event.Skip()
+        
+    def _doResize(self):
+        # The window may have been closed while we were waiting
+        if not self:
+            return
+            
+        # Get the current size of the window less the navigation toolbar
         w, h = self.GetClientSize()
-        wt, ht = self.toolbar.GetSize()
         
-        dpi = self.figure.get_dpi()
-        newW = 1.0*w/dpi
-        newH = 1.0*(h-ht)/dpi
-        self.figure.set_size_inches((newW, newH))
-        self.figure.tight_layout()
-        self.figure.canvas.draw()
+        newW = w*self._invDpi
+        newH = (h-self._toolbarHeight)*self._invDpi
+        if (newW, newH) == self._figureSize:
+            return
+        self._figureSize = (newW, newH)
+        
+        self.figure.set_size_inches(self._figureSize)
+        self.figure.canvas.draw_idle()
         
     def GetToolBar(self):
         # You will need to override GetToolBar if you are using an 
@@ -839,9 +1476,9 @@ if __name__ == "__main__":
         )
     parser.add_argument('-t', '--target', type=str, 
                         help='target name')
-    parser.add_argument('-r', '--ra', type=aph.hours, 
+    parser.add_argument('-r', '--ra', type=_sexagesimal_type(RA_RE, 'RA'), 
                         help='target RA; HH:MM:SS.SS format, J2000')
-    parser.add_argument('-d', '--dec', type=aph.degrees, 
+    parser.add_argument('-d', '--dec', type=_sexagesimal_type(DEC_RE, 'declination'), 
                         help='target declination; sDD:MM:SS.S format, J2000')
     args = parser.parse_args()
     
@@ -8,7 +8,7 @@ a list of beam ID (zero indexed) and deals with conflicts by mapping all conflic
 to beam 0.
 """
 
-from functools import cmp_to_key
+import numpy
 
 __version__ = '0.1'
 __all__ = ['lowestIdleBeam', 'unravelObs', 'assignBeams']
@@ -26,6 +26,33 @@ def lowestIdleBeam(beams):
     return -1
 
 
+def _unravelArrays(obs):
+    """
+    Given a list of sdf.Observation instances, return the event times, 
+    observation indicies, and start (1)/stop (0) markers as numpy arrays 
+    along with the permutation that puts them into time order.
+    """
+    
+    nObs = len(obs)
+    
+    # Find the start and stop times of the observations.  We will worry 
+    # about the time order later
+    mjd = numpy.fromiter((o.mjd for o in obs), dtype=numpy.float64, count=nObs)
+    mpm = numpy.fromiter((o.mpm for o in obs), dtype=numpy.float64, count=nObs)
+    dur = numpy.fromiter((o.dur for o in obs), dtype=numpy.float64, count=nObs)
+    start = mjd + mpm/1000.0/3600.0/24.0
+    stop = start + dur/1000.0/3600.0/24.0
+    
+    times = numpy.concatenate([start, stop])
+    index = numpy.concatenate([numpy.arange(nObs), numpy.arange(nObs)])
+    marker = numpy.concatenate([numpy.ones(nObs, dtype=numpy.int8), numpy.zeros(nObs, dtype=numpy.int8)])
+    
+    # Sort by time then observation ID number.  lexsort is stable so a 
+    # start always comes before the stop at the same time.
+    order = numpy.lexsort((index, times))
+    return times, index, marker, order
+
+
 def unravelObs(obs):
     """
     Given a list of sdf.Observation instances, unravel them into a
@@ -33,42 +60,8 @@ def unravelObs(obs):
     the event is a start (1) or stop (0).
     """
     
-    # Loop over the observations.  We will worry about the time order 
-    # later
-    rObs = []
-    for i in range(len(obs)):
-        iStart =  obs[i].mjd + obs[i].mpm/1000.0/3600.0/24.0
-        iStop = iStart + obs[i].dur/1000.0/3600.0/24.0
-        
-        rObs.append( (iStart, i, 1) )
-        rObs.append( (iStop,  i, 0) )
-    
-    def cmpObs(x, y):
-        """
-        Comparison function for the list of three-element tuples 
-        generated in the parent function.  This sorts the list by time 
-        then observation ID number.
-        """
-        
-        f1X = x[0]
-        f2X = x[1]
-        f1Y = y[0]
-        f2Y = y[1]
-        
-        if f1X < f1Y:
-            return -1
-        elif f1X > f1Y:
-            return 1
-        else:
-            if f2X < f2Y:
-                return -1
-            elif f2X > f2Y:
-                return 1
-            else:
-                return 0
-    
-    # Sort and return
-    return sorted(rObs, key=cmp_to_key(cmpObs))
+    times, index, marker, order = _unravelArrays(obs)
+    return list(zip(times[order].tolist(), index[order].tolist(), marker[order].tolist()))
 
 
 def assignBeams(obs, nBeams=4):
@@ -82,32 +75,38 @@ def assignBeams(obs, nBeams=4):
     beams = [-1]*len(obs)
     activeBeams = [-1]*nBeams
     
-    # Unravel the observations
-    sObs = unravelObs(obs)
+    # Bit mask of the idle beams - bit i is set if beam i is idle
+    idleBeams = (1 << nBeams) - 1
+    
+    # Unravel the observations - only the time order is needed here, not
+    # the times themselves
+    times, index, marker, order = _unravelArrays(obs)
     
     # Loop over the unraveled observations
-    for t,o,m in sObs:
+    for o,m in zip(index[order].tolist(), marker[order].tolist()):
         if m:
             # Observation starts
-            toUse = lowestIdleBeam(activeBeams)
+            ## The lowest set bit is the lowest idle beam
+            lowest = idleBeams & -idleBeams
             
             # If there are no free beams (a conflict) we put the conflicting
             # observation into beam 0.
-            if toUse == -1:
+            if lowest == 0:
                 toUse = 0
-            
+            else:
+                toUse = lowest.bit_length() - 1
+                idleBeams ^= lowest
+                
             beams[o] = toUse
             activeBeams[toUse] = o
         else:
             # Observation ends
-            try:
-                # Why is there a try...except block here?  Because of the
-                # conflict resolution that the other part of this if...else
-                # block uses.  If we can't find the observation that probably
-                # means its part of zero.
-                toStop = activeBeams.index(o)
+            ## Because of the conflict resolution used above the beam may
+            ## have been taken over by another observation.  If so, it is
+            ## still busy.
+            toStop = beams[o]
+            if activeBeams[toStop] == o:
                 activeBeams[toStop] = -1
-            except ValueError:
-                pass
+                idleBeams |= 1 << toStop
     
     return beams
@@ -1719,7 +1719,7 @@ class SDFCreator(wx.Frame):
         self.listControl.Fit()
         
         size = self.GetSize()
-        width = min([width, wx.GetDisplaySize()[0]])
+        width = min(width, wx.GetDisplaySize()[0])
         self.SetMinSize((width, size[1]))
         self.panel.SetupScrolling(scroll_x=True, scroll_y=False)
         self.Fit()
@@ -1575,7 +1575,7 @@ class IDFCreator(wx.Frame):
         self.listControl.Fit()
         
         size = self.GetSize()
-        width = min([width, wx.GetDisplaySize()[0]])
+        width = min(width, wx.GetDisplaySize()[0])
         self.SetMinSize((width, size[1]))
         self.panel.SetupScrolling(scroll_x=True, scroll_y=False)
         self.Fit()
@@ -0,0 +1,95 @@
+"""
+Unit tests for the beam assignment in the conflict module.
+"""
+
+import unittest
+import sys
+import os
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import conflict
+
+
+__version__  = "0.1"
+__author__   = "Jayce Dowell"
+
+
+# Minimal stand-in for sdf.Observation with only the timing attributes that
+# the conflict module uses
+_Observation = namedtuple('_Observation', ['mjd', 'mpm', 'dur'])
+
+
+def _build_obs(*spans):
+    """
+    Build a list of observations on the same day from (start, stop) pairs
+    given in seconds.
+    """
+    
+    return [_Observation(60000, int(start*1000), int((stop-start)*1000)) for start,stop in spans]
+
+
+class conflict_tests(unittest.TestCase):
+    """A unittest.TestCase collection of unit tests for the conflict module."""
+    
+    def test_unravel(self):
+        """Test the time ordering of the unraveled observations."""
+        
+        obs = _build_obs((10, 20), (0, 10))
+        sObs = conflict.unravelObs(obs)
+        self.assertEqual([(o,m) for t,o,m in sObs], [(1,1), (0,1), (1,0), (0,0)])
+    
+    def test_overlapping(self):
+        """Test beam assignment for overlapping observations."""
+        
+        obs = _build_obs((0, 10), (5, 15), (12, 20))
+        self.assertEqual(conflict.assignBeams(obs), [0, 1, 0])
+    
+    def test_back_to_back(self):
+        """Test beam assignment for back-to-back observations."""
+        
+        obs = _build_obs((0, 10), (10, 20), (20, 30))
+        self.assertEqual(conflict.assignBeams(obs), [0, 0, 0])
+        
+        ## A start is handled before a stop at the same time if the starting
+        ## observation comes first in the list
+        obs = _build_obs((10, 20), (0, 10))
+        self.assertEqual(conflict.assignBeams(obs), [1, 0])
+    
+    def test_simultaneous(self):
+        """Test beam assignment for observations that start at the same time."""
+        
+        obs = _build_obs((0, 10), (0, 10), (0, 10), (0, 5))
+        self.assertEqual(conflict.assignBeams(obs), [0, 1, 2, 3])
+    
+    def test_conflict(self):
+        """Test that conflicting observations are mapped to beam 0."""
+        
+        obs = _build_obs((0, 10), (0, 10), (0, 10), (0, 10), (0, 10))
+        self.assertEqual(conflict.assignBeams(obs), [0, 1, 2, 3, 0])
+        
+        ## The end of a conflicting observation frees beam 0
+        obs = _build_obs((0, 10), (0, 20), (5, 8), (9, 12))
+        self.assertEqual(conflict.assignBeams(obs, nBeams=2), [0, 1, 0, 0])
+    
+    def test_midnight(self):
+        """Test beam assignment for observations that cross a day boundary."""
+        
+        obs = [_Observation(60000, 86390000, 20000), _Observation(60001, 0, 5000)]
+        self.assertEqual(conflict.assignBeams(obs), [0, 1])
+
+
+class conflict_test_suite(unittest.TestSuite):
+    """A unittest.TestSuite class which contains all of the conflict module
+    tests."""
+    
+    def __init__(self):
+        unittest.TestSuite.__init__(self)
+        
+        loader = unittest.TestLoader()
+        self.addTests(loader.loadTestsFromTestCase(conflict_tests))
+
+
+if __name__ == '__main__':
+    unittest.main()
+